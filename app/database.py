@@ -8,6 +8,7 @@ from enum import Enum
 
 from app.schemas import Message
 from app.utils import generate_random_alphanumeric
+from app.search import SearchIndex
 
 class DatabaseException(Exception):
     pass
@@ -20,12 +21,14 @@ def parse_Enum(cls) -> str:
 class Database:
     data: dict[str, dict]
     last_update: float
+    index: SearchIndex
     
-    def __init__(self, data: dict[str, dict], last_update: float) -> None:
+    def __init__(self, data: dict[str, dict], last_update: float, search_fields: tuple[str, ...] = ()) -> None:
         if data is None:
             raise DatabaseException('database not initialized')
         self.data = json.loads(data)
         self.last_update = last_update
+        self.index = SearchIndex(search_fields, self.data)
     
     def get_unique_id(self) -> str:
         while True:
@@ -47,9 +50,13 @@ class Database:
     def get(self, id: str) -> dict|None:
         return self.data.get(id)
     
+    def search(self, query: str, limit: int = 20) -> list[dict]:
+        return [self.data[id] for id in self.index.search(query, limit=limit)]
+    
     def add(self, new_data: dict) -> dict:
         id = self.get_unique_id()
         self.data[id] = {**new_data, 'id': id}
+        self.index.add(id, self.data[id])
         self.last_update = datetime.now().timestamp()
         return self.data[id]
         
@@ -57,6 +64,7 @@ class Database:
         if self.data.get(id) is None:
             return DatabaseException('ID not found')
         self.data[id].update(new_data)
+        self.index.update(id, self.data[id])
         self.last_update = datetime.now().timestamp()
         return self.data[id]
         
@@ -64,17 +72,22 @@ class Database:
         if self.data.get(id) is None:
             return DatabaseException('ID not found')
         del self.data[id]
+        self.index.remove(id)
         self.last_update = datetime.now().timestamp()
         
 class Firebase:
     collection_id: str = "unique"
     collection_name: str
     data_type: type[BaseModel]
+    search_fields: tuple[str, ...]
+    database: Database|None
     
-    def __init__(self, db_conection, collection_name: str, data_type: type[BaseModel]) -> None:
+    def __init__(self, db_conection, collection_name: str, data_type: type[BaseModel], search_fields: tuple[str, ...] = ()) -> None:
         self.db_conection = db_conection
         self.collection_name = collection_name
         self.data_type = data_type
+        self.search_fields = search_fields
+        self.database = None
         
     def parse_object(self, obj: dict|BaseModel) -> BaseModel:
         try:
@@ -87,7 +100,11 @@ class Firebase:
             doc_ref = self.db_conection.collection(self.collection_name).document(self.collection_id)
             doc_snapshot = doc_ref.get()
             if doc_snapshot.exists:
-                return Database(**doc_snapshot.to_dict())
+                snapshot = doc_snapshot.to_dict()
+                # reuses the cached database (and its search index) while the stored data is unchanged
+                if self.database is None or self.database.last_update != snapshot.get('last_update'):
+                    self.database = Database(**snapshot, search_fields=self.search_fields)
+                return self.database
         except Exception as e:
             print(e)
             raise HTTPException(status_code=500, detail='there was an error accessing the database during synchronization')
@@ -106,6 +123,11 @@ class Firebase:
         
         return list(map(self.parse_object, database.get_all()))
 
+    async def search(self, query: str, limit: int = 20) -> list[BaseModel]:
+        database = await self.sync_data()
+        
+        return list(map(self.parse_object, database.search(query, limit=limit)))
+
     async def create(self, new_data: BaseModel) -> BaseModel:
         database = await self.sync_data()
         
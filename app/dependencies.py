@@ -24,7 +24,7 @@ cred = credentials.Certificate({
 firebase_admin.initialize_app(cred)
 firebase_db = firestore.client()
 
-ActivityDatabase = Firebase(firebase_db, 'activities_raw', Activity)
+ActivityDatabase = Firebase(firebase_db, 'activities_raw', Activity, search_fields=('nome_disciplina', 'docentes'))
 
 def get_db():
     yield ActivityDatabase
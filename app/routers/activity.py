@@ -1,4 +1,4 @@
-from fastapi import APIRouter, status, Depends, Security
+from fastapi import APIRouter, status, Depends, Security, Query
 from fastapi.security.api_key import APIKeyHeader
 
 from app.metadata import Tags
@@ -28,6 +28,28 @@ router = APIRouter(
 async def get_all_activities(db: Firebase=Depends(get_db)) -> list[Activity]:
     return await db.get_all()
 
+@router.get('/search',
+    status_code=status.HTTP_200_OK,
+    response_model=list[Activity],
+    response_description='Matching Activities retrieved successfully',
+    summary='Search Activities',
+    description='Search activities by subject name or teachers, ignoring accents and case. Results are ranked by match quality.',
+    responses={
+        422: {
+            'description': "Invalid query parameters."
+        },
+        500: {
+            'description': "Internal server error."
+        }
+    }
+)
+async def search_activities(
+    q: str=Query(min_length=1, max_length=100),
+    limit: int=Query(default=20, ge=1, le=100),
+    db: Firebase=Depends(get_db)
+) -> list[Activity]:
+    return await db.search(q, limit=limit)
+
 @router.post('/', 
     status_code=status.HTTP_201_CREATED, 
     response_model=Activity,
@@ -0,0 +1,89 @@
+import re
+import unicodedata
+from collections import Counter
+
+NON_ALPHANUMERIC = re.compile(r'[^0-9A-Z]+')
+
+def fold_text(text: str) -> str:
+    text = unicodedata.normalize('NFKD', str(text))
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return NON_ALPHANUMERIC.sub(' ', text.upper()).strip()
+
+def get_trigrams(text: str) -> set[str]:
+    trigrams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        trigrams.update(padded[i:i+3] for i in range(len(padded) - 2))
+    return trigrams
+
+class SearchIndex:
+    fields: tuple[str, ...]
+    values: dict[str, set[str]]
+    value_ids: dict[str, set[str]]
+    value_trigrams: dict[str, int]
+    postings: dict[str, set[str]]
+
+    def __init__(self, fields: tuple[str, ...], data: dict[str, dict]|None = None) -> None:
+        self.fields = fields
+        self.values = {}
+        self.value_ids = {}
+        self.value_trigrams = {}
+        self.postings = {}
+        for id, item in (data or {}).items():
+            self.add(id, item)
+
+    def add(self, id: str, item: dict) -> None:
+        values = {fold_text(item[field]) for field in self.fields if item.get(field)}
+        values.discard('')
+        self.values[id] = values
+        # the same subjects and teachers repeat across many classes, so postings are kept per distinct value
+        for value in values:
+            if value not in self.value_ids:
+                self.value_ids[value] = set()
+                trigrams = get_trigrams(value)
+                self.value_trigrams[value] = len(trigrams)
+                for trigram in trigrams:
+                    self.postings.setdefault(trigram, set()).add(value)
+            self.value_ids[value].add(id)
+
+    def remove(self, id: str) -> None:
+        for value in self.values.pop(id, ()):
+            ids = self.value_ids[value]
+            ids.discard(id)
+            if len(ids) > 0:
+                continue
+            del self.value_ids[value]
+            del self.value_trigrams[value]
+            for trigram in get_trigrams(value):
+                values = self.postings[trigram]
+                values.discard(value)
+                if len(values) == 0:
+                    del self.postings[trigram]
+
+    def update(self, id: str, item: dict) -> None:
+        self.remove(id)
+        self.add(id, item)
+
+    def search(self, query: str, limit: int = 20, threshold: float = 0.5) -> list[str]:
+        query = fold_text(query)
+        query_trigrams = get_trigrams(query)
+        if len(query_trigrams) == 0:
+            return []
+
+        matches = Counter()
+        for trigram in query_trigrams:
+            matches.update(self.postings.get(trigram, ()))
+
+        min_matches = max(1, int(len(query_trigrams) * threshold))
+        candidates = [value for value, count in matches.items() if count >= min_matches]
+
+        # trigram recall ranks first, ties go to exact substring matches and then to values with fewer unmatched trigrams
+        candidates.sort(key=lambda value: (matches[value], query in value, matches[value] / self.value_trigrams[value]), reverse=True)
+
+        results = {}
+        for value in candidates:
+            for id in sorted(self.value_ids[value]):
+                results.setdefault(id, None)
+            if len(results) >= limit:
+                break
+        return list(results)[:limit]